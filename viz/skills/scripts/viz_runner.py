@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Thin runner for viz skill. Validates, executes, and polls for rendered output."""
-import argparse, os, subprocess, sys, time
+import argparse, fnmatch, os, subprocess, sys, time
 from pathlib import Path
 
 VIZ_DIR = Path(".viz")
 
 def existing_plots():
-    return sorted(p.stem for p in VIZ_DIR.glob("*.png"))
+    return sorted(n[:-4] for n in os.listdir(VIZ_DIR) if n.endswith(".png"))
+
+def read_tail(path, limit=64 * 1024):
+    # Only the end of a runaway stderr log is useful; the traceback is last.
+    with open(path, "rb") as f:
+        f.seek(max(0, os.fstat(f.fileno()).st_size - limit))
+        return f.read().decode("utf-8", "replace")
 
 def run(name, overwrite):
     VIZ_DIR.mkdir(exist_ok=True)
@@ -14,26 +20,32 @@ def run(name, overwrite):
     if not script.exists():
         sys.exit(f"ERROR: {script} not found")
     data_patterns = [f"{name}.parquet", f"{name}.csv", f"{name}_*.parquet", f"{name}_*.csv"]
-    if not any(VIZ_DIR.glob(p) for p in data_patterns):
+    entries = os.listdir(VIZ_DIR)
+    if not any(fnmatch.filter(entries, p) for p in data_patterns):
         sys.exit(f"ERROR: No data files matching {name}.parquet/csv or {name}_*.parquet/csv in .viz/")
-    if png.exists() and not overwrite:
-        sys.exit(f"ERROR: '{name}.png' already exists. Use --overwrite to update.\nExisting plots: {', '.join(existing_plots())}")
-    if overwrite and png.exists():
+    if png.exists():
+        if not overwrite:
+            sys.exit(f"ERROR: '{name}.png' already exists. Use --overwrite to update.\nExisting plots: {', '.join(existing_plots())}")
         png.unlink()
     env = os.environ.copy()
     env["MPLBACKEND"] = "macosx" if sys.platform == "darwin" else "TkAgg"
-    with open(err_file, "w") as ef:
-        subprocess.Popen([sys.executable, script.name], cwd=str(VIZ_DIR),
-                         env=env, start_new_session=True, stdout=subprocess.DEVNULL, stderr=ef)
-    elapsed = 0.0
-    while elapsed < 30.0:
+    with open(err_file, "wb") as ef:
+        proc = subprocess.Popen([sys.executable, script.name], cwd=str(VIZ_DIR),
+                                env=env, start_new_session=True, stdout=subprocess.DEVNULL, stderr=ef)
+    deadline, interval = time.monotonic() + 30.0, 0.005
+    while (remaining := deadline - time.monotonic()) > 0:
+        exited = proc.poll() is not None
         if png.exists():
             err_file.unlink(missing_ok=True)
             print(f"VIZ: {name} | {png}")
             return
-        time.sleep(0.2)
-        elapsed += 0.2
-    stderr_content = err_file.read_text().strip() if err_file.exists() else ""
+        if exited:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(0.2, interval * 1.5)
+    stderr_content = read_tail(err_file).strip() if err_file.exists() else ""
+    if proc.returncode is not None:
+        sys.exit(f"ERROR: Script exited with code {proc.returncode} before creating {png.name}\n{stderr_content}".rstrip())
     if stderr_content:
         sys.exit(f"ERROR: PNG not created within timeout\n{stderr_content}")
     sys.exit("ERROR: Script timed out after 30s. No stderr output captured.")
@@ -44,9 +56,8 @@ def list_plots():
     plots = existing_plots()
     if not plots:
         return print("No visualizations found in .viz/")
-    print("Visualizations in .viz/:")
-    for p in plots:
-        print(f"  {p:<20} {p}.png")
+    width = max(20, *map(len, plots))
+    print("Visualizations in .viz/:\n" + "\n".join(f"  {p:<{width}} {p}.png" for p in plots))
 
 def main():
     ap = argparse.ArgumentParser(description="Viz runner")